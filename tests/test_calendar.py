@@ -64,6 +64,13 @@ class TestCalendar:
         assert len(resources) == 1
         assert resources[0] == "alice"
 
+    def test_iter_resources(self):
+        """Test iterating over resource IDs."""
+        calendar = Calendar(["alice", "bob"])
+        
+        assert list(calendar.iter_resources()) == ["alice", "bob"]
+        assert list(Calendar().iter_resources()) == []
+
     def test_get_calendar(self):
         """Test getting individual resource calendars."""
         calendar = Calendar(["alice", "bob"])
@@ -143,6 +150,42 @@ class TestCalendar:
         
         assert "alice" in calendar.get_all_resources()
 
+    def test_add_slots_bulk(self):
+        """Test bulk slot addition across resources."""
+        calendar = Calendar(["alice"])
+        calendar.add_slot("alice", 10, 12, "existing")
+        
+        results = calendar.add_slots_bulk([
+            ("alice", 0, 5, "a1"),
+            ("bob", 10, 12, "b1"),
+            ("alice", 11, 13, "a2"),  # Conflicts with existing
+            ("bob", 11, 15, "b2"),    # Conflicts with b1
+        ])
+        
+        assert results == [True, True, False, False]
+        assert "bob" in calendar.get_all_resources()
+        assert calendar.get_calendar("alice").get_all_slots() == [
+            (0, 5, "a1"), (10, 12, "existing")
+        ]
+        assert calendar.get_calendar("bob").get_all_slots() == [(10, 12, "b1")]
+
+    def test_add_slots_bulk_with_shift(self):
+        """Test bulk slot addition with shifting across resources."""
+        calendar = Calendar(["alice"])
+        calendar.add_slot("alice", 10, 15, "existing")
+        
+        results = calendar.add_slots_bulk_with_shift([
+            ("alice", 12, 14, "a1"),  # Shifted after existing
+            ("bob", 10, 12, "b1"),
+            ("alice", 12, 14, "a2"),  # Shifted after a1
+            ("bob", 11, 13, "b2"),    # Shifted after b1
+        ])
+        
+        assert results == [(15, 17), (10, 12), (17, 19), (12, 14)]
+        assert calendar.get_calendar("bob").get_all_slots() == [
+            (10, 12, "b1"), (12, 14, "b2")
+        ]
+
     def test_get_slots_at_single_resource(self):
         """Test getting slots at specific time for single resource."""
         calendar = Calendar(["alice"])
@@ -181,6 +224,20 @@ class TestCalendar:
         }
         assert slots_set == expected_set
 
+    def test_get_slots_in_range(self):
+        """Test getting slots overlapping a time range across resources."""
+        calendar = Calendar(["alice", "bob"])
+        calendar.add_slot("alice", 10, 15, "alice_meeting")
+        calendar.add_slot("alice", 20, 25, "alice_review")
+        calendar.add_slot("bob", 30, 35, "bob_meeting")
+        
+        assert calendar.get_slots_in_range(12, 22) == [
+            ("alice", 10, 15, "alice_meeting"),
+            ("alice", 20, 25, "alice_review"),
+        ]
+        assert calendar.get_slots_in_range(15, 20) == []
+        assert len(calendar.get_slots_in_range(0, 100)) == 3
+
     def test_multiple_resources_independent(self):
         """Test that resources operate independently."""
         calendar = Calendar(["alice", "bob"])
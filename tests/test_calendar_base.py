@@ -2,8 +2,11 @@
 Tests for CalendarBase class.
 """
 
+import random
+
 import pytest
 from timeslotassigner import CalendarBase
+from timeslotassigner import calendar as calendar_module
 
 
 class TestCalendarBase:
@@ -112,6 +115,179 @@ class TestCalendarBase:
         assert actual_start == 35  # Should be shifted after the last conflicting slot
         assert actual_end == 55    # Duration preserved (32-12=20)
 
+    def test_add_slots_bulk(self):
+        """Test bulk addition of sorted, non-overlapping slots."""
+        calendar = CalendarBase("test_resource")
+        calendar.add_slot(10, 12, "existing")
+        
+        results = calendar.add_slots_bulk([(0, 5, "a"), (11, 13, "b"), (20, 25, "c")])
+        assert results == [True, False, True]
+        
+        slots = calendar.get_all_slots()
+        assert slots == [(0, 5, "a"), (10, 12, "existing"), (20, 25, "c")]
+
+    def test_add_slots_bulk_large_sorted_batch(self):
+        """Test a large sorted batch merged between existing slots."""
+        calendar = CalendarBase("test_resource", intern_data=True)
+        for i in range(200):
+            calendar.add_slot(i * 10, i * 10 + 2, "existing")
+        
+        batch = [(i * 5, i * 5 + 3, "new") for i in range(400)]
+        expected = [i % 2 == 1 for i in range(400)]  # Even ones hit existing slots
+        
+        assert calendar.add_slots_bulk(batch) == expected
+        slots = calendar.get_all_slots()
+        assert len(slots) == 400
+        assert [start for start, _, _ in slots] == sorted(start for start, _, _ in slots)
+        assert calendar.get_slot_at(6) == (5, 8, "new")
+        assert calendar.get_slot_at(10) == (10, 12, "existing")
+
+    def test_add_slots_bulk_unsorted_batch(self):
+        """Test an unsorted but non-overlapping batch matches one-by-one adds."""
+        calendar = CalendarBase("test_resource")
+        calendar.add_slot(10, 12, "existing")
+        
+        # More slots than the small-batch cutoff, so the batch is sorted and
+        # checked against the existing slots only
+        batch = [(i * 10, i * 10 + 5, f"s{i}") for i in (7, 3, 9, 0, 5, 6, 11, 2, 8)]
+        batch.append((11, 13, "conflict"))
+        
+        reference = CalendarBase("reference")
+        reference.add_slot(10, 12, "existing")
+        expected = [reference.add_slot(*slot) for slot in batch]
+        
+        assert calendar.add_slots_bulk(batch) == expected
+        assert expected == [True] * 9 + [False]
+        assert calendar.get_all_slots() == reference.get_all_slots()
+
+    def test_add_slots_bulk_overlapping_batch(self):
+        """Test bulk addition where slots in the batch overlap each other."""
+        calendar = CalendarBase("test_resource")
+        
+        # Same result as adding one by one in the given order
+        results = calendar.add_slots_bulk([(20, 25, "a"), (10, 22, "b"), (10, 15, "c")])
+        assert results == [True, False, True]
+        assert calendar.get_all_slots() == [(10, 15, "c"), (20, 25, "a")]
+        
+        # A large unsorted batch that overlaps itself goes in order too
+        batch = [((i * 7) % 50, (i * 7) % 50 + 6, i) for i in range(20)]
+        reference = CalendarBase("reference")
+        expected = [reference.add_slot(*slot) for slot in batch]
+        calendar = CalendarBase("test_resource")
+        assert calendar.add_slots_bulk(batch) == expected
+        assert calendar.get_all_slots() == reference.get_all_slots()
+
+    def test_add_slots_bulk_invalid_range(self):
+        """Test bulk addition rejects invalid ranges before adding anything."""
+        calendar = CalendarBase("test_resource")
+        
+        with pytest.raises(ValueError):
+            calendar.add_slots_bulk([(0, 5, "a"), (10, 10, "zero_duration")])
+        assert calendar.get_all_slots() == []
+
+    def test_add_slots_bulk_with_shift(self):
+        """Test bulk addition with shift matches one-by-one shifted adds."""
+        calendar = CalendarBase("test_resource")
+        calendar.add_slot(10, 15, "existing")
+        calendar.add_slot(40, 50, "later")
+        
+        batch = [(12, 14, f"s{i}") for i in range(14)]
+        results = calendar.add_slots_bulk_with_shift(batch)
+        
+        # Slots fill the gap after "existing", then skip over "later"
+        expected = [(15 + 2 * i, 17 + 2 * i) for i in range(14)]
+        expected[-2:] = [(50, 52), (52, 54)]
+        assert results == expected
+        assert len(calendar.get_all_slots()) == 16
+        assert calendar.get_slot_at(51) == (50, 52, "s12")
+
+    def test_count_conflicts(self):
+        """Test counting conflicts without modifying the calendar."""
+        calendar = CalendarBase("test_resource")
+        calendar.add_slot(10, 15, "a")
+        calendar.add_slot(20, 25, "b")
+        
+        ranges = [(0, 10), (5, 11), (14, 20), (15, 20), (22, 23), (25, 30), (0, 100)]
+        assert calendar.count_conflicts(ranges) == 4
+        assert [calendar.count_conflicts([r]) for r in ranges] == [0, 1, 1, 0, 1, 0, 1]
+        slots = calendar.get_all_slots()
+        assert calendar.count_conflicts(ranges) == sum(
+            any(s < end and start < e for s, e, _ in slots) for start, end in ranges
+        )
+        assert len(calendar.get_all_slots()) == 2
+        assert CalendarBase("empty").count_conflicts(ranges) == 0
+
+    def test_intern_data(self):
+        """Test equal string data is shared when interning is enabled."""
+        calendar = CalendarBase("test_resource", intern_data=True)
+        
+        label = "".join(["stand", "up"])
+        calendar.add_slot(10, 12, "standup")
+        calendar.add_slot(20, 22, label)
+        calendar.add_slots_bulk([(30, 32, "".join(["stand", "up"])), (40, 42, 7)])
+        
+        slots = calendar.get_all_slots()
+        assert slots[1][2] is slots[0][2]
+        assert slots[2][2] is slots[0][2]
+        assert slots[3] == (40, 42, 7)
+        
+        # The shared labels are released once the calendar is empty
+        for start, _, _ in slots:
+            calendar.remove_slot(start)
+        label = "".join(["stand", "up"])
+        calendar.add_slot(10, 12, label)
+        assert calendar.get_slot_at(10)[2] is label
+
+    def test_compact(self):
+        """Test packed bound storage behaves like the default storage."""
+        calendar = CalendarBase("test_resource", compact=True)
+        
+        assert calendar.add_slot(10, 12, "meeting") is True
+        assert calendar.add_slot(11, 13, "conflict") is False
+        assert calendar.add_slots_bulk([(20, 25, "a"), (0, 5, "b")]) == [True, True]
+        assert calendar.add_slot_with_shift(10, 14, "shifted") == (12, 16)
+        assert calendar.remove_slot(0) is True
+        
+        assert calendar.get_all_slots() == [
+            (10, 12, "meeting"), (12, 16, "shifted"), (20, 25, "a")
+        ]
+        assert calendar.get_slot_at(21) == (20, 25, "a")
+        assert calendar.left_slot(20) == (12, 16, "shifted")
+        
+        # Times outside int64 are rejected without leaving a partial slot
+        with pytest.raises(OverflowError):
+            calendar.add_slot(2**63 - 1, 2**63)
+        with pytest.raises(OverflowError):
+            calendar.add_slots_bulk([(2**63 - 1, 2**63, "big")])
+        assert len(calendar.get_all_slots()) == 3
+
+    def test_len_and_contains(self):
+        """Test counting and membership without listing all slots."""
+        calendar = CalendarBase("test_resource")
+        assert len(calendar) == 0
+        
+        calendar.add_slot(10, 12, "meeting")
+        calendar.add_slot(20, 25, "review")
+        
+        assert len(calendar) == 2
+        assert (10, 12, "meeting") in calendar
+        assert (10, 12, "other") not in calendar
+        assert (10, 13, "meeting") not in calendar
+        assert (11, 12, "meeting") not in calendar
+        assert (10, 12) not in calendar
+        assert 10 not in calendar
+
+    def test_iter(self):
+        """Test iterating over slots in chronological order."""
+        calendar = CalendarBase("test_resource")
+        assert list(calendar) == []
+        
+        calendar.add_slot(20, 25, "review")
+        calendar.add_slot(10, 12, "meeting")
+        
+        assert list(calendar) == calendar.get_all_slots()
+        assert next(iter(calendar)) == (10, 12, "meeting")
+
     def test_remove_slot_success(self):
         """Test successful slot removal."""
         calendar = CalendarBase("test_resource")
@@ -154,6 +330,41 @@ class TestCalendarBase:
         assert calendar.get_slot_at(20) == (20, 25, "meeting2")  # Second slot
         assert calendar.get_slot_at(25) is None   # After all slots
 
+    def test_get_payload_at(self):
+        """Test getting only the data of the active slot."""
+        calendar = CalendarBase("test_resource")
+        calendar.add_slot(10, 15, "meeting")
+        calendar.add_slot(20, 25)
+        
+        assert calendar.get_payload_at(9) is None
+        assert calendar.get_payload_at(10) == "meeting"
+        assert calendar.get_payload_at(14) == "meeting"
+        assert calendar.get_payload_at(15) is None
+        assert calendar.get_payload_at(22) is None  # Slot without data
+
+    def test_get_slot_at_after_changes(self):
+        """Test repeated queries see slots added and removed in between."""
+        calendar = CalendarBase("test_resource")
+        
+        assert calendar.get_slot_at(11) is None
+        calendar.add_slot(10, 12, "meeting")
+        assert calendar.get_slot_at(11) == (10, 12, "meeting")
+        calendar.remove_slot(10)
+        assert calendar.get_slot_at(11) is None
+        calendar.add_slots_bulk([(10, 15, "a"), (20, 25, "b")])
+        assert calendar.get_slot_at(11) == (10, 15, "a")
+
+    def test_get_slots_in_range(self):
+        """Test getting slots overlapping a time range."""
+        calendar = CalendarBase("test_resource")
+        calendar.add_slots_bulk([(0, 5, "a"), (10, 15, "b"), (20, 25, "c")])
+        
+        assert calendar.get_slots_in_range(4, 20) == [(0, 5, "a"), (10, 15, "b")]
+        assert calendar.get_slots_in_range(5, 10) == []
+        assert calendar.get_slots_in_range(-10, 100) == calendar.get_all_slots()
+        with pytest.raises(ValueError):
+            calendar.get_slots_in_range(10, 10)
+
     def test_left_slot(self):
         """Test getting the slot immediately to the left."""
         calendar = CalendarBase("test_resource")
@@ -238,4 +449,36 @@ class TestCalendarBase:
         right = calendar.right_slot(test_start)
         
         assert left[0] == test_start - 10  # Previous slot
-        assert right[0] == test_start + 10  # Next slot
\ No newline at end of file
+        assert right[0] == test_start + 10  # Next slot
+
+    def test_small_blocks(self, monkeypatch):
+        """Test inserts, removals and lookups across many storage blocks."""
+        monkeypatch.setattr(calendar_module, "_BLOCK_SIZE", 2)
+        calendar = CalendarBase("test_resource")
+        rng = random.Random(0)  # noqa: S311 - seeded test data, not crypto
+        starts = list(range(0, 400, 4))
+        rng.shuffle(starts)
+        
+        for start in starts:
+            assert calendar.add_slot(start, start + 2, start) is True
+        assert calendar.add_slot(101, 103, "conflict") is False
+        
+        expected = sorted((start, start + 2, start) for start in starts)
+        assert calendar.get_all_slots() == expected
+        
+        for start in starts[::2]:
+            assert calendar.remove_slot(start) is True
+            expected.remove((start, start + 2, start))
+        assert calendar.get_all_slots() == expected
+        assert len(calendar) == len(expected)
+        
+        for i, slot in enumerate(expected):
+            assert calendar.get_slot_at(slot[0] + 1) == slot
+            assert calendar.left_slot(slot[0]) == (expected[i - 1] if i else None)
+            assert calendar.right_slot(slot[0]) == (
+                expected[i + 1] if i + 1 < len(expected) else None
+            )
+        low, high = 100, 200
+        assert calendar.get_slots_in_range(low, high) == [
+            slot for slot in expected if slot[1] > low and slot[0] < high
+        ]
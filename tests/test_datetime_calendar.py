@@ -34,6 +34,18 @@ class TestDatetimeUtilities:
         expected_epoch = int(dt_utc.timestamp())
         assert epoch == expected_epoch
 
+    def test_datetime_to_epoch_naive_before_epoch(self):
+        """Test naive and UTC datetimes before 1970 truncate toward zero like timestamp()."""
+        for dt in [
+            datetime(1969, 12, 31, 23, 59, 59, 500000),
+            datetime(1969, 12, 31, 23, 59, 58, 1),
+            datetime(1900, 3, 1, 12, 0, 0),
+        ]:
+            dt_utc = dt.replace(tzinfo=timezone.utc)
+            expected_epoch = int(dt_utc.timestamp())
+            assert _datetime_to_epoch(dt) == expected_epoch
+            assert _datetime_to_epoch(dt_utc) == expected_epoch
+
     def test_datetime_to_epoch_different_timezone(self):
         """Test datetime to epoch conversion with different timezone."""
         # Tokyo timezone (UTC+9)
@@ -68,6 +80,15 @@ class TestDatetimeUtilities:
         expected_tokyo = datetime(2024, 1, 15, 19, 30, 0, tzinfo=tokyo_tz)
         assert dt_tokyo == expected_tokyo
 
+    def test_epoch_to_datetime_keeps_timezone_object(self):
+        """Test equal but distinct timezones aren't mixed up by caching."""
+        named = timezone(timedelta(hours=9), "JST")
+        unnamed = timezone(timedelta(hours=9))
+        
+        assert _epoch_to_datetime(0, named).tzinfo is named
+        assert _epoch_to_datetime(0, unnamed).tzinfo is unnamed
+        assert _epoch_to_datetime(0, named).tzname() == "JST"
+
     def test_roundtrip_conversion(self):
         """Test that datetime -> epoch -> datetime roundtrip works."""
         original_dt = datetime(2024, 1, 15, 10, 30, 45, tzinfo=timezone.utc)
@@ -163,6 +184,50 @@ class TestDatetimeCalendarBase:
         slots = calendar.get_all_slots()
         assert len(slots) == 2
 
+    def test_add_slots_bulk(self):
+        """Test bulk slot addition with datetime objects."""
+        calendar = DatetimeCalendarBase("test_resource")
+        
+        day = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        slots = [
+            (day.replace(hour=9), day.replace(hour=10), "standup"),
+            (day.replace(hour=9, minute=30), day.replace(hour=11), "conflict"),
+            (day.replace(hour=14), day.replace(hour=15), "review"),
+        ]
+        
+        assert calendar.add_slots_bulk(slots) == [True, False, True]
+        assert calendar.get_all_slots() == [slots[0], slots[2]]
+
+    def test_add_slots_bulk_with_shift(self):
+        """Test bulk slot addition with shifting using datetime objects."""
+        calendar = DatetimeCalendarBase("test_resource")
+        
+        day = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        calendar.add_slot(day.replace(hour=9), day.replace(hour=10), "standup")
+        
+        results = calendar.add_slots_bulk_with_shift([
+            (day.replace(hour=9), day.replace(hour=11), "review"),
+            (day.replace(hour=9), day.replace(hour=10), "sync"),
+        ])
+        
+        assert results == [
+            (day.replace(hour=10), day.replace(hour=12)),
+            (day.replace(hour=12), day.replace(hour=13)),
+        ]
+
+    def test_count_conflicts(self):
+        """Test counting conflicts with datetime objects."""
+        calendar = DatetimeCalendarBase("test_resource")
+        
+        day = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        calendar.add_slot(day.replace(hour=9), day.replace(hour=10), "standup")
+        
+        ranges = [
+            (day.replace(hour=8), day.replace(hour=9)),
+            (day.replace(hour=9, minute=30), day.replace(hour=11)),
+        ]
+        assert calendar.count_conflicts(ranges) == 1
+
     def test_remove_slot(self):
         """Test slot removal with datetime objects."""
         calendar = DatetimeCalendarBase("test_resource")
@@ -198,6 +263,45 @@ class TestDatetimeCalendarBase:
         assert calendar.get_slot_at(at_end) is None  # End is exclusive
         assert calendar.get_slot_at(after) is None
 
+    def test_get_payload_at(self):
+        """Test getting only the data of the slot at a datetime."""
+        calendar = DatetimeCalendarBase("test_resource")
+        
+        start = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        calendar.add_slot(start, end, "meeting")
+        
+        assert calendar.get_payload_at(datetime(2024, 1, 15, 11, 0, tzinfo=timezone.utc)) == "meeting"
+        assert calendar.get_payload_at(end) is None
+
+    def test_get_all_slots_larger_than_conversion_cache(self):
+        """Test listing more slots than the conversion cache holds."""
+        jst = timezone(timedelta(hours=9))
+        calendar = DatetimeCalendarBase("test_resource", default_timezone=jst)
+        
+        day = datetime(2024, 1, 15, tzinfo=jst)
+        slots = [
+            (day + timedelta(minutes=2 * i), day + timedelta(minutes=2 * i + 1), i)
+            for i in range(5000)
+        ]
+        calendar.add_slots_bulk(slots)
+        
+        all_slots = calendar.get_all_slots()
+        assert all_slots == slots
+        assert all_slots[-1][0].tzinfo is jst
+
+    def test_get_slots_in_range(self):
+        """Test getting slots overlapping a datetime range."""
+        calendar = DatetimeCalendarBase("test_resource")
+        
+        day = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        standup = (day.replace(hour=9), day.replace(hour=10), "standup")
+        review = (day.replace(hour=14), day.replace(hour=15), "review")
+        calendar.add_slots_bulk([standup, review])
+        
+        assert calendar.get_slots_in_range(day, day.replace(hour=12)) == [standup]
+        assert calendar.get_slots_in_range(day.replace(hour=10), day.replace(hour=14)) == []
+
     def test_left_right_slot(self):
         """Test left and right slot navigation."""
         calendar = DatetimeCalendarBase("test_resource")
@@ -224,6 +328,33 @@ class TestDatetimeCalendarBase:
         assert calendar.right_slot(slot2_start) == (slot3_start, slot3_end, "meeting3")
         assert calendar.right_slot(slot3_start) is None  # No slot after last
 
+    def test_len_and_contains(self):
+        """Test counting and membership with datetime slots."""
+        calendar = DatetimeCalendarBase("test_resource")
+        
+        start = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        calendar.add_slot(start, end, "meeting")
+        
+        jst = timezone(timedelta(hours=9))
+        assert len(calendar) == 1
+        assert (start, end, "meeting") in calendar
+        assert (start.astimezone(jst), end.astimezone(jst), "meeting") in calendar
+        assert (start, end, "other") not in calendar
+        assert (0, 1, "meeting") not in calendar
+
+    def test_iter(self):
+        """Test iterating over datetime slots."""
+        jst = timezone(timedelta(hours=9))
+        calendar = DatetimeCalendarBase("test_resource", default_timezone=jst)
+        
+        start = datetime(2024, 1, 15, 10, 0, tzinfo=jst)
+        end = datetime(2024, 1, 15, 12, 0, tzinfo=jst)
+        calendar.add_slot(start, end, "meeting")
+        
+        assert list(calendar) == [(start, end, "meeting")]
+        assert list(calendar)[0][0].tzinfo is jst
+
     def test_timezone_consistency(self):
         """Test timezone handling consistency."""
         tokyo_tz = timezone(timedelta(hours=9))
@@ -307,6 +438,39 @@ class TestDatetimeCalendar:
         }
         assert slots_set == expected_set
 
+    def test_get_slots_at_naive_query(self):
+        """Test naive query datetimes use the calendar's default timezone."""
+        jst = timezone(timedelta(hours=9))
+        calendar = DatetimeCalendar(["alice"], default_timezone=jst)
+        
+        start = datetime(2024, 1, 15, 9, 0, tzinfo=jst)
+        end = datetime(2024, 1, 15, 10, 0, tzinfo=jst)
+        calendar.add_slot("alice", start, end, "standup")
+        
+        slots = calendar.get_slots_at(datetime(2024, 1, 15, 9, 30))
+        assert slots == [("alice", start, end, "standup")]
+        assert slots[0][1].tzinfo is jst
+        assert calendar.get_slots_at(datetime(2024, 1, 15, 0, 30)) == []
+
+    def test_get_slots_in_range_multi_resource(self):
+        """Test getting slots overlapping a datetime range across resources."""
+        jst = timezone(timedelta(hours=9))
+        calendar = DatetimeCalendar(["alice", "bob"], default_timezone=jst)
+        
+        start = datetime(2024, 1, 15, 9, 0, tzinfo=jst)
+        end = datetime(2024, 1, 15, 10, 0, tzinfo=jst)
+        calendar.add_slot("alice", start, end, "standup")
+        calendar.add_slot("bob", start, end, "standup")
+        
+        slots = calendar.get_slots_in_range(
+            datetime(2024, 1, 15, 8, 0), datetime(2024, 1, 15, 9, 30)
+        )
+        assert slots == [
+            ("alice", start, end, "standup"),
+            ("bob", start, end, "standup"),
+        ]
+        assert calendar.get_slots_in_range(end, end + timedelta(hours=1)) == []
+
     def test_add_slot_with_shift_multi_resource(self):
         """Test slot shifting across multiple resources."""
         calendar = DatetimeCalendar(["alice"])
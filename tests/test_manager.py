@@ -272,6 +272,43 @@ class TestCalendarManager:
         assert len(alice_slots) == 1
         assert alice_slots[0] == (10, 12, "meeting1")
 
+    def test_bulk_assign_slots_invalid_range(self):
+        """Test bulk assignment rejects invalid ranges before assigning anything."""
+        manager = CalendarManager()
+        
+        with pytest.raises(ValueError):
+            manager.bulk_assign_slots([
+                ("engineering", "alice", 10, 12, "ok"),
+                ("marketing", "bob", 15, 15, "zero_duration"),
+            ])
+        assert manager.get_all_slots_at(10) == []
+
+    def test_bulk_assign_slots_large_groups(self):
+        """Test bulk assignment with many slots per resource matches one-by-one adds."""
+        manager = CalendarManager()
+        reference = CalendarManager()
+        
+        # Unsorted but disjoint slots for alice, overlapping slots for bob,
+        # interleaved, with more than a handful of slots per resource
+        alice = [("engineering", "alice", i * 10, i * 10 + 5, f"a{i}")
+                 for i in (9, 2, 7, 0, 4, 11, 1, 6, 3, 10)]
+        bob = [("engineering", "bob", (i * 7) % 40, (i * 7) % 40 + 6, f"b{i}")
+               for i in range(12)]
+        assignments = [slot for pair in zip(alice, bob[:10], strict=True) for slot in pair]
+        assignments += bob[10:]
+        assignments.append(("engineering", "alice", 21, 23, "a_conflict"))
+        
+        expected = [reference.add_slot(*assignment) for assignment in assignments]
+        assert manager.bulk_assign_slots(assignments) == expected
+        assert expected[-1] is False
+        assert False in expected[:-1]  # Some of bob's overlapping slots fail
+        
+        for resource in ("alice", "bob"):
+            assert (
+                manager.get_calendar("engineering").get_calendar(resource).get_all_slots()
+                == reference.get_calendar("engineering").get_calendar(resource).get_all_slots()
+            )
+
     def test_bulk_assign_slots_with_shift(self):
         """Test bulk slot assignment with automatic shifting."""
         manager = CalendarManager()
@@ -291,6 +328,33 @@ class TestCalendarManager:
         assert results[2] == (10, 15)  # No shift needed
         assert results[3] == (15, 20)  # Shifted after meeting3
 
+    def test_bulk_assign_slots_with_shift_interleaved(self):
+        """Test bulk shifting keeps per-resource order with interleaved resources."""
+        manager = CalendarManager()
+        
+        assignments = [
+            ("engineering", "alice", 10, 20, "a1"),
+            ("engineering", "bob", 10, 20, "b1"),
+            ("engineering", "alice", 5, 15, "a2"),   # Shifted after a1
+            ("marketing", "alice", 10, 20, "m1"),    # Different calendar, no shift
+            ("engineering", "bob", 0, 5, "b2"),      # Fits before b1
+        ]
+        
+        results = manager.bulk_assign_slots_with_shift(assignments)
+        assert results == [(10, 20), (10, 20), (20, 30), (10, 20), (0, 5)]
+        assert manager.get_all_calendar_keys() == ["engineering", "marketing"]
+
+    def test_bulk_assign_slots_with_shift_invalid_range(self):
+        """Test bulk shifting rejects invalid ranges before assigning anything."""
+        manager = CalendarManager()
+        
+        with pytest.raises(ValueError):
+            manager.bulk_assign_slots_with_shift([
+                ("engineering", "alice", 10, 12, "ok"),
+                ("engineering", "alice", 15, 15, "zero_duration"),
+            ])
+        assert manager.get_all_slots_at(10) == []
+
     def test_complex_multi_team_scenario(self):
         """Test complex scenario with multiple teams and resources."""
         manager = CalendarManager()
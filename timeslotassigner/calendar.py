@@ -4,22 +4,70 @@ Calendar classes for managing time-slots and resource assignments.
 
 from __future__ import annotations
 
-from typing import Any
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain, pairwise
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
-from sortedcontainers import SortedDict
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, MutableSequence
+
+# Slots per storage block. A block is split in half once it holds twice this
+# many, so adding or removing a slot only shifts part of one block
+_BLOCK_SIZE = 1000
+
+# Above this many accepted slots, add_slots_bulk may rebuild the blocks in one
+# merge pass instead of inserting slot by slot
+_MERGE_THRESHOLD = 64
+
+_start_of = itemgetter(0)
+
+# Batches up to this size are added slot by slot
+_SMALL_BATCH = 8
 
 
 class CalendarBase:
     """Base class for managing time-slots for a single resource."""
 
-    def __init__(self, resource_id: str) -> None:
+    # Thousands of these can exist, one per resource, so skip the __dict__
+    __slots__ = (
+        "_compact",
+        "_data",
+        "_ends",
+        "_interned",
+        "_maxes",
+        "_starts",
+        "resource_id",
+    )
+
+    def __init__(
+        self, resource_id: str, *, intern_data: bool = False, compact: bool = False
+    ) -> None:
         """Initialize a calendar for a single resource.
 
         Args:
             resource_id: Unique identifier for the resource (person, room, etc.)
+            intern_data: Store equal string data as one shared object, which saves
+                memory when many slots carry the same label. Labels stay in the
+                shared table after their slots are removed, until the calendar
+                is empty again
+            compact: Store slot bounds as packed 64-bit integers instead of int
+                objects. Uses about a fifth of the memory per bound, but searches
+                are slower and adding a time outside the signed 64-bit range
+                raises OverflowError
         """
         self.resource_id = resource_id
-        self._slots: SortedDict[int, tuple[int, Any]] = SortedDict()
+        self._interned: dict[str, str] | None = {} if intern_data else None
+        self._compact = compact
+        # Slots are stored sorted by start time in blocks of parallel sequences.
+        # Slots never overlap, so ends are sorted too, and _maxes holds the last
+        # end of every block: a lookup is one C-level bisect over _maxes and one
+        # within a block, and an insert or removal only shifts part of a block.
+        self._starts: list[MutableSequence[int]] = []
+        self._ends: list[MutableSequence[int]] = []
+        self._data: list[list[Any]] = []
+        self._maxes: list[int] = []
 
     def add_slot(self, start: int, end: int, data: Any = None) -> bool:
         """Add a time-slot if it doesn't conflict with existing slots.
@@ -44,10 +92,16 @@ class CalendarBase:
         """
         if start >= end:
             raise ValueError(f"Start time ({start}) must be less than end time ({end})")
-        if self._has_conflict(start, end):
-            return False
+        maxes = self._maxes
+        if maxes and start >= maxes[-1]:
+            # Past the last slot, so nothing can conflict: append in O(1)
+            self._append(start, end, data)
+            return True
 
-        self._slots[start] = (end, data)
+        position = self._insertion_position(start, end)
+        if position is None:
+            return False
+        self._insert(position, start, end, data)
         return True
 
     def add_slot_with_shift(
@@ -76,12 +130,172 @@ class CalendarBase:
         if start >= end:
             raise ValueError(f"Start time ({start}) must be less than end time ({end})")
         duration = end - start
-        actual_start = self._find_available_slot(start, duration)
-        actual_end = actual_start + duration
+        maxes = self._maxes
+        if maxes and start >= maxes[-1]:
+            # Past the last slot, so no shift is needed: append in O(1)
+            self._append(start, end, data)
+            return start, end
 
-        self._slots[actual_start] = (actual_end, data)
+        actual_start, position = self._find_available_slot(start, duration)
+        actual_end = actual_start + duration
+        self._insert(position, actual_start, actual_end, data)
         return actual_start, actual_end
 
+    def add_slots_bulk(self, slots: Iterable[tuple[int, int, Any]]) -> list[bool]:
+        """Add many time-slots at once.
+
+        Behaves like calling add_slot for each slot in order. When the slots
+        don't overlap each other, in any order, they are only checked against
+        the existing slots and inserted in a single batch.
+
+        Args:
+            slots: Iterable of (start, end, data) tuples
+
+        Returns:
+            List of bool indicating success/failure for each slot
+
+        Raises:
+            ValueError: If any slot has start >= end (no slot is added)
+
+        Example:
+            >>> calendar = CalendarBase("alice")
+            >>> calendar.add_slot(10, 12, "meeting")
+            True
+            >>> calendar.add_slots_bulk([(0, 5, "a"), (11, 13, "b"), (20, 25, "c")])
+            [True, False, True]
+        """
+        slots = list(slots)
+        if not slots:
+            return []
+        for start, end, _ in slots:
+            if start >= end:
+                raise ValueError(
+                    f"Start time ({start}) must be less than end time ({end})"
+                )
+
+        if len(slots) <= _SMALL_BATCH:
+            # Batch bookkeeping costs more than it saves on a handful of slots
+            return self._add_in_order(slots)
+
+        if any(prev[1] > cur[0] for prev, cur in pairwise(slots)):
+            order = sorted(range(len(slots)), key=lambda i: slots[i][0])
+            if any(slots[i][1] > slots[j][0] for i, j in pairwise(order)):
+                # Slots overlap each other, so insertion order matters
+                return self._add_in_order(slots)
+
+            # Unsorted but disjoint: no slot can block another, so each result
+            # only depends on the existing slots and the batch can go in sorted
+            results = [False] * len(slots)
+            sorted_results = self._add_sorted_batch([slots[i] for i in order])
+            for i, success in zip(order, sorted_results, strict=True):
+                results[i] = success
+            return results
+
+        return self._add_sorted_batch(slots)
+
+    def add_slots_bulk_with_shift(
+        self, slots: Iterable[tuple[int, int, Any]]
+    ) -> list[tuple[int, int]]:
+        """Add many time-slots at once, shifting each one if necessary.
+
+        Behaves like calling add_slot_with_shift for each slot in order, but
+        the shifted slots are merged into the calendar in a single pass.
+
+        Args:
+            slots: Iterable of (start, end, data) tuples
+
+        Returns:
+            List of (actual_start, actual_end) tuples for each slot
+
+        Raises:
+            ValueError: If any slot has start >= end (no slot is added)
+
+        Example:
+            >>> calendar = CalendarBase("alice")
+            >>> calendar.add_slot(10, 15, "existing")
+            True
+            >>> calendar.add_slots_bulk_with_shift([(12, 14, "a"), (12, 14, "b")])
+            [(15, 17), (17, 19)]
+        """
+        slots = list(slots)
+        for start, end, _ in slots:
+            if start >= end:
+                raise ValueError(
+                    f"Start time ({start}) must be less than end time ({end})"
+                )
+
+        results = []
+        if len(slots) <= _SMALL_BATCH:
+            for start, end, data in slots:
+                duration = end - start
+                actual_start, position = self._find_available_slot(start, duration)
+                self._insert(position, actual_start, actual_start + duration, data)
+                results.append((actual_start, actual_start + duration))
+            return results
+
+        # Slots placed by this batch are kept apart from the existing ones until
+        # the end. A candidate is pushed past existing and placed slots in turn
+        # until neither blocks it; both only ever move it forward.
+        placed_starts: list[int] = []
+        placed_ends: list[int] = []
+        placed: list[tuple[int, int, Any]] = []
+        for placed_count, (start, end, data) in enumerate(slots):
+            duration = end - start
+            current_time = start
+            while True:
+                current_time, _ = self._find_available_slot(current_time, duration)
+                shifted = current_time
+                idx = bisect_right(placed_ends, shifted)
+                while idx < placed_count and placed_starts[idx] < shifted + duration:
+                    shifted = placed_ends[idx]
+                    idx += 1
+                if shifted == current_time:
+                    break
+                current_time = shifted
+            actual_end = current_time + duration
+            placed_starts.insert(idx, current_time)
+            placed_ends.insert(idx, actual_end)
+            placed.insert(idx, (current_time, actual_end, data))
+            results.append((current_time, actual_end))
+
+        self._add_disjoint(placed)
+        return results
+
+    def count_conflicts(self, ranges: Iterable[tuple[int, int]]) -> int:
+        """Count how many ranges would conflict with existing slots.
+
+        The calendar is not modified, so each range is checked against the
+        current slots only, not against the other ranges.
+
+        Args:
+            ranges: Iterable of (start, end) tuples
+
+        Returns:
+            Number of ranges that overlap at least one existing slot
+
+        Example:
+            >>> calendar = CalendarBase("alice")
+            >>> calendar.add_slot(10, 12, "meeting")
+            True
+            >>> calendar.count_conflicts([(0, 5), (11, 13), (12, 14)])
+            1
+        """
+        # Slots never overlap, so ends are sorted too: the first slot ending
+        # after a range's start is the only one that can overlap it.
+        maxes = self._maxes
+        block_starts = self._starts
+        block_ends = self._ends
+        count = len(maxes)
+        conflicts = 0
+        for start, end in ranges:
+            block = bisect_right(maxes, start)
+            if (
+                block < count
+                and block_starts[block][bisect_right(block_ends[block], start)] < end
+            ):
+                conflicts += 1
+        return conflicts
+
     def remove_slot(self, start: int) -> bool:
         """Remove a time-slot starting at the given time.
 
@@ -100,11 +314,11 @@ class CalendarBase:
             >>> calendar.remove_slot(10)
             False
         """
-        try:
-            del self._slots[start]
+        block, offset = self._locate(start)
+        if block < len(self._maxes) and self._starts[block][offset] == start:
+            self._remove(block, offset)
             return True
-        except KeyError:
-            return False
+        return False
 
     def get_slot_at(self, time: int) -> tuple[int, int, Any] | None:
         """Get the slot active at the given time.
@@ -127,20 +341,100 @@ class CalendarBase:
             >>> calendar.get_slot_at(12)
             None
         """
-        idx = self._slots.bisect_right(time) - 1
-        if idx >= 0:
-            start, (end, data) = self._slots.peekitem(idx)
-            if start <= time < end:
-                return start, end, data
+        # The first slot ending after time is the only one that can contain it
+        maxes = self._maxes
+        block = bisect_right(maxes, time)
+        if block < len(maxes):
+            ends = self._ends[block]
+            offset = bisect_right(ends, time)
+            starts = self._starts[block]
+            if starts[offset] <= time:
+                return starts[offset], ends[offset], self._data[block][offset]
         return None
 
+    def get_payload_at(self, time: int) -> Any:
+        """Get only the data of the slot active at the given time.
+
+        Cheaper than get_slot_at when the slot bounds aren't needed.
+
+        Args:
+            time: Time to check
+
+        Returns:
+            Data of the active slot, or None if no slot is active (a slot whose
+            data is None also returns None; use get_slot_at to tell them apart)
+
+        Example:
+            >>> calendar = CalendarBase("alice")
+            >>> calendar.add_slot(10, 12, "meeting")
+            True
+            >>> calendar.get_payload_at(11)
+            'meeting'
+        """
+        maxes = self._maxes
+        block = bisect_right(maxes, time)
+        if block < len(maxes):
+            offset = bisect_right(self._ends[block], time)
+            if self._starts[block][offset] <= time:
+                return self._data[block][offset]
+        return None
+
+    # Integer lookups that subclass overrides of the public methods don't
+    # replace, for callers that already hold epoch times (Calendar and the
+    # datetime classes)
+    _slot_at_epoch = get_slot_at
+
     def get_all_slots(self) -> list[tuple[int, int, Any]]:
         """Get all slots in chronological order.
 
         Returns:
             List of (start, end, data) tuples
         """
-        return [(start, end, data) for start, (end, data) in self._slots.items()]
+        return list(self._iter_slots())
+
+    def get_slots_in_range(self, start: int, end: int) -> list[tuple[int, int, Any]]:
+        """Get all slots overlapping the range [start, end), in chronological order.
+
+        Args:
+            start: Start of the range
+            end: End of the range
+
+        Returns:
+            List of (start, end, data) tuples
+
+        Raises:
+            ValueError: If start >= end
+
+        Example:
+            >>> calendar = CalendarBase("alice")
+            >>> calendar.add_slots_bulk([(0, 5, "a"), (10, 15, "b"), (20, 25, "c")])
+            [True, True, True]
+            >>> calendar.get_slots_in_range(4, 20)
+            [(0, 5, 'a'), (10, 15, 'b')]
+        """
+        if start >= end:
+            raise ValueError(f"Start time ({start}) must be less than end time ({end})")
+        # Slots never overlap, so ends are sorted too and the overlapping slots
+        # form one contiguous run: those ending after start and starting before end
+        first, offset = self._locate(start)
+        result: list[tuple[int, int, Any]] = []
+        for block in range(first, len(self._maxes)):
+            starts = self._starts[block]
+            stop = bisect_left(starts, end, offset)
+            result.extend(
+                zip(
+                    starts[offset:stop],
+                    self._ends[block][offset:stop],
+                    self._data[block][offset:stop],
+                    strict=True,
+                )
+            )
+            if stop < len(starts):
+                break
+            offset = 0
+        return result
+
+    _slots_in_range_epoch = get_slots_in_range
 
     def left_slot(self, start: int) -> tuple[int, int, Any] | None:
         """Get the slot immediately before the given start time.
@@ -151,10 +445,14 @@ class CalendarBase:
         Returns:
             Tuple of (start, end, data) of the previous slot, or None if no previous slot
         """
-        idx = self._slots.bisect_left(start) - 1
-        if idx >= 0:
-            prev_start, (prev_end, data) = self._slots.peekitem(idx)
-            return prev_start, prev_end, data
+        block, offset = self._locate(start)
+        if block < len(self._maxes) and self._starts[block][offset] < start:
+            return self._slot(block, offset)
+        # Otherwise it's the slot just before the first one ending after start
+        if offset:
+            return self._slot(block, offset - 1)
+        if block:
+            return self._slot(block - 1, len(self._starts[block - 1]) - 1)
         return None
 
     def right_slot(self, start: int) -> tuple[int, int, Any] | None:
@@ -166,60 +464,308 @@ class CalendarBase:
         Returns:
             Tuple of (start, end, data) of the next slot, or None if no next slot
         """
-        idx = self._slots.bisect_right(start)
-        if idx < len(self._slots):
-            next_start, (next_end, data) = self._slots.peekitem(idx)
-            return next_start, next_end, data
-        return None
-
-    def _has_conflict(self, start: int, end: int) -> bool:
-        """Check if a time range conflicts with existing slots."""
-        # Check if any existing slot overlaps with [start, end)
-        idx = self._slots.bisect_left(start)
+        block, offset = self._locate(start)
+        count = len(self._maxes)
+        if block == count:
+            return None
+        if self._starts[block][offset] <= start:
+            # That slot contains start, so the next slot is the one after it
+            offset += 1
+            if offset == len(self._starts[block]):
+                block, offset = block + 1, 0
+                if block == count:
+                    return None
+        return self._slot(block, offset)
+
+    def __len__(self) -> int:
+        """Return the number of slots without building them."""
+        return sum(map(len, self._starts))
+
+    def __iter__(self) -> Iterator[tuple[int, int, Any]]:
+        """Iterate over (start, end, data) slots in chronological order.
+
+        Slots are produced on demand, so scanning a large calendar doesn't
+        build the whole list that get_all_slots returns. Don't add or remove
+        slots while iterating.
+        """
+        return self._iter_slots()
 
-        # Check slot that might end after our start
-        if idx > 0:
-            _, (prev_end, _) = self._slots.peekitem(idx - 1)
-            if prev_end > start:
-                return True
+    def __contains__(self, slot: object) -> bool:
+        """Check whether a (start, end, data) slot is in the calendar.
 
-        # Check slots that might start before our end
-        if idx < len(self._slots):
-            next_start, _ = self._slots.peekitem(idx)
-            if next_start < end:
-                return True
+        Example:
+            >>> calendar = CalendarBase("alice")
+            >>> calendar.add_slot(10, 12, "meeting")
+            True
+            >>> (10, 12, "meeting") in calendar
+            True
+        """
+        if not isinstance(slot, tuple):
+            return False
+        try:
+            start, end, data = slot
+        except ValueError:
+            return False
+        block, offset = self._locate(start)
+        return (
+            block < len(self._maxes)
+            and self._starts[block][offset] == start
+            and self._ends[block][offset] == end
+            and self._data[block][offset] == data
+        )
+
+    def _slot(self, block: int, offset: int) -> tuple[int, int, Any]:
+        """Get the slot at the given position as a (start, end, data) tuple."""
+        return (
+            self._starts[block][offset],
+            self._ends[block][offset],
+            self._data[block][offset],
+        )
+
+    def _iter_slots(self) -> Iterator[tuple[int, int, Any]]:
+        """Iterate over (start, end, data) slots across the blocks."""
+        return zip(
+            chain.from_iterable(self._starts),
+            chain.from_iterable(self._ends),
+            chain.from_iterable(self._data),
+            strict=True,
+        )
+
+    def _locate(self, time: int) -> tuple[int, int]:
+        """Get the (block, offset) position of the first slot ending after time.
+
+        The block is len(self._maxes) when no slot ends after time.
+        """
+        maxes = self._maxes
+        block = bisect_right(maxes, time)
+        if block == len(maxes):
+            return block, 0
+        return block, bisect_right(self._ends[block], time)
+
+    def _insert(self, position: tuple[int, int], start: int, end: int, data: Any) -> None:
+        """Insert a slot at the given (block, offset) position."""
+        if self._interned is not None and type(data) is str:
+            data = self._interned.setdefault(data, data)
+        block, offset = position
+        maxes = self._maxes
+        if block == len(maxes):
+            if maxes:
+                # Past the last slot goes at the end of the last block
+                block -= 1
+                offset = len(self._starts[block])
+            else:
+                self._extend_columns(*self._columns([(start, end, data)]))
+                return
 
-        return False
+        starts = self._starts[block]
+        ends = self._ends[block]
+        starts.insert(offset, start)
+        try:
+            ends.insert(offset, end)
+        except OverflowError:
+            # Only compact bounds can overflow; keep the sequences in step
+            del starts[offset]
+            raise
+        self._data[block].insert(offset, data)
+        if offset == len(ends) - 1:
+            maxes[block] = end
+        if len(starts) >= 2 * _BLOCK_SIZE:
+            self._split(block)
+
+    def _append(self, start: int, end: int, data: Any) -> None:
+        """Append a slot after the last one of a non-empty calendar."""
+        if self._interned is not None and type(data) is str:
+            data = self._interned.setdefault(data, data)
+        starts = self._starts[-1]
+        starts.append(start)
+        try:
+            self._ends[-1].append(end)
+        except OverflowError:
+            # Only compact bounds can overflow; keep the sequences in step
+            del starts[-1]
+            raise
+        self._data[-1].append(data)
+        self._maxes[-1] = end
+        if len(starts) >= 2 * _BLOCK_SIZE:
+            self._split(len(self._maxes) - 1)
+
+    def _split(self, block: int) -> None:
+        """Split a full block in two halves."""
+        half = len(self._starts[block]) // 2
+        starts = self._starts[block]
+        ends = self._ends[block]
+        data = self._data[block]
+        self._starts.insert(block + 1, starts[half:])
+        self._ends.insert(block + 1, ends[half:])
+        self._data.insert(block + 1, data[half:])
+        del starts[half:]
+        del ends[half:]
+        del data[half:]
+        # The old maximum now belongs to the second half
+        self._maxes.insert(block, self._ends[block][-1])
+
+    def _remove(self, block: int, offset: int) -> None:
+        """Remove the slot at the given position."""
+        starts = self._starts[block]
+        del starts[offset]
+        del self._ends[block][offset]
+        del self._data[block][offset]
+        if starts:
+            self._maxes[block] = self._ends[block][-1]
+        else:
+            # Emptied blocks are dropped; partly emptied ones are kept as they
+            # are, since a lookup costs the same whatever a block holds
+            del self._starts[block]
+            del self._ends[block]
+            del self._data[block]
+            del self._maxes[block]
+            if not self._maxes and self._interned:
+                # Nothing refers to the shared labels any more
+                self._interned.clear()
+
+    def _add_in_order(self, slots: list[tuple[int, int, Any]]) -> list[bool]:
+        """Add validated slots one at a time, in the given order."""
+        results = []
+        for start, end, data in slots:
+            maxes = self._maxes
+            if maxes and start >= maxes[-1]:
+                self._append(start, end, data)
+                results.append(True)
+                continue
+            position = self._insertion_position(start, end)
+            if position is not None:
+                self._insert(position, start, end, data)
+            results.append(position is not None)
+        return results
+
+    def _add_sorted_batch(self, slots: list[tuple[int, int, Any]]) -> list[bool]:
+        """Add sorted, mutually disjoint slots checking only existing slots."""
+        maxes = self._maxes
+        if not maxes or slots[0][0] >= maxes[-1]:
+            # The whole batch goes after the last slot, so nothing can conflict
+            self._extend_columns(*self._columns(slots))
+            return [True] * len(slots)
+
+        results = [
+            self._insertion_position(start, end) is not None
+            for start, end, _ in slots
+        ]
+        self._add_disjoint(
+            [slot for slot, success in zip(slots, results, strict=True) if success]
+        )
+        return results
+
+    def _add_disjoint(self, slots: list[tuple[int, int, Any]]) -> None:
+        """Add sorted slots that overlap neither each other nor existing slots."""
+        if not slots:
+            return
+        maxes = self._maxes
+        if not maxes or slots[0][0] >= maxes[-1]:
+            self._extend_columns(*self._columns(slots))
+        elif len(slots) > _MERGE_THRESHOLD and len(slots) * 4 > len(self):
+            # Rebuilding every block beats inserting once the batch is a
+            # sizeable share of the calendar. Timsort finds the two sorted
+            # runs and merges them in linear time.
+            columns = self._columns(sorted(chain(self._iter_slots(), slots), key=_start_of))
+            self._starts = []
+            self._ends = []
+            self._data = []
+            self._maxes = []
+            self._extend_columns(*columns)
+        else:
+            # Nothing in the batch conflicts, so every slot still has a free
+            # position after the earlier ones are inserted
+            for start, end, data in slots:
+                self._insert(self._locate(start), start, end, data)
+
+    def _columns(
+        self, slots: list[tuple[int, int, Any]]
+    ) -> tuple[MutableSequence[int], MutableSequence[int], list[Any]]:
+        """Split slots into start, end and data sequences ready for storage.
+
+        Raises OverflowError before anything is stored if compact bounds
+        don't fit in 64 bits.
+        """
+        starts: MutableSequence[int] = [start for start, _, _ in slots]
+        ends: MutableSequence[int] = [end for _, end, _ in slots]
+        if self._compact:
+            starts = array("q", starts)
+            ends = array("q", ends)
+        interned = self._interned
+        if interned is None:
+            data = [data for _, _, data in slots]
+        else:
+            data = [
+                interned.setdefault(data, data) if type(data) is str else data
+                for _, _, data in slots
+            ]
+        return starts, ends, data
+
+    def _extend_columns(
+        self, starts: MutableSequence[int], ends: MutableSequence[int], data: list[Any]
+    ) -> None:
+        """Append sorted columns that all start after the last existing slot."""
+        size = len(starts)
+        taken = 0
+        if self._maxes:
+            # Top up the last block before starting new ones
+            last = len(self._maxes) - 1
+            taken = min(size, 2 * _BLOCK_SIZE - 1 - len(self._starts[last]))
+            if taken:
+                self._starts[last].extend(starts[:taken])
+                self._ends[last].extend(ends[:taken])
+                self._data[last].extend(data[:taken])
+                self._maxes[last] = ends[taken - 1]
+        for i in range(taken, size, _BLOCK_SIZE):
+            stop = i + _BLOCK_SIZE
+            self._starts.append(starts[i:stop])
+            self._ends.append(ends[i:stop])
+            self._data.append(data[i:stop])
+            self._maxes.append(ends[min(stop, size) - 1])
+
+    def _insertion_position(self, start: int, end: int) -> tuple[int, int] | None:
+        """Get the position where [start, end) can be inserted, or None on conflict."""
+        position = self._locate(start)
+        block, offset = position
+        # The first slot ending after start conflicts if it also starts before end
+        if block < len(self._maxes) and self._starts[block][offset] < end:
+            return None
+        return position
+
+    def _find_available_slot(
+        self, preferred_start: int, duration: int
+    ) -> tuple[int, tuple[int, int]]:
+        """Find the earliest available slot of given duration at or after preferred_start.
 
-    def _find_available_slot(self, preferred_start: int, duration: int) -> int:
-        """Find the earliest available slot of given duration at or after preferred_start."""
+        Returns:
+            Tuple of (start, insertion position) for the free slot
+        """
         current_time = preferred_start
-
-        while True:
-            if not self._has_conflict(current_time, current_time + duration):
-                return current_time
-
-            # Find the next slot that ends after current_time
-            idx = self._slots.bisect_right(current_time) - 1
-            if idx >= 0:
-                _, (end, _) = self._slots.peekitem(idx)
-                if end > current_time:
-                    current_time = end
-                    continue
-
-            # Check the next slot that starts after current_time
-            idx = self._slots.bisect_left(current_time)
-            if idx < len(self._slots):
-                _, (next_end, _) = self._slots.peekitem(idx)
-                current_time = next_end
-            else:
-                # No more conflicts, can place at current_time
-                return current_time
+        # This is the first slot that could be in the way. Every blocking slot
+        # pushes current_time to its end, and the next slot always ends later
+        # still, so the sweep only moves forward.
+        block, offset = self._locate(current_time)
+        block_starts = self._starts
+        block_ends = self._ends
+        count = len(self._maxes)
+        while block < count:
+            starts = block_starts[block]
+            ends = block_ends[block]
+            size = len(starts)
+            while offset < size and starts[offset] < current_time + duration:
+                current_time = ends[offset]
+                offset += 1
+            if offset < size:
+                break
+            block, offset = block + 1, 0
+        return current_time, (block, offset)
 
 
 class Calendar:
     """Calendar manager for multiple resources."""
 
+    __slots__ = ("_calendars",)
+
     def __init__(self, resources: list[str] | None = None) -> None:
         """Initialize a multi-resource calendar.
 
@@ -249,11 +795,9 @@ class Calendar:
         Returns:
             True if resource was removed, False if it didn't exist
         """
-        try:
-            del self._calendars[resource_id]
-            return True
-        except KeyError:
-            return False
+        # Calendars are never None, so a pop default tells a miss apart without
+        # raising and catching KeyError
+        return self._calendars.pop(resource_id, None) is not None
 
     def get_calendar(self, resource_id: str) -> CalendarBase | None:
         """Get the calendar for a specific resource.
@@ -280,10 +824,12 @@ class Calendar:
         Returns:
             True if slot was added successfully, False otherwise
         """
-        if resource_id not in self._calendars:
+        calendar = self._calendars.get(resource_id)
+        if calendar is None:
             self.add_resource(resource_id)
+            calendar = self._calendars[resource_id]
 
-        return self._calendars[resource_id].add_slot(start, end, data)
+        return calendar.add_slot(start, end, data)
 
     def add_slot_with_shift(
         self, resource_id: str, start: int, end: int, data: Any = None
@@ -299,10 +845,93 @@ class Calendar:
         Returns:
             Tuple of (actual_start, actual_end) after any necessary shifting
         """
-        if resource_id not in self._calendars:
+        calendar = self._calendars.get(resource_id)
+        if calendar is None:
             self.add_resource(resource_id)
+            calendar = self._calendars[resource_id]
+
+        return calendar.add_slot_with_shift(start, end, data)
+
+    def add_slots_bulk(
+        self, slots: Iterable[tuple[str, int, int, Any]]
+    ) -> list[bool]:
+        """Add many slots across resources at once.
+
+        Slots are grouped by resource and each group is handed to that
+        resource's CalendarBase.add_slots_bulk, so the result matches adding
+        them one by one in the given order.
+
+        Args:
+            slots: Iterable of (resource_id, start, end, data) tuples
+
+        Returns:
+            List of bool indicating success/failure for each slot
 
-        return self._calendars[resource_id].add_slot_with_shift(start, end, data)
+        Raises:
+            ValueError: If any slot has start >= end
+        """
+        groups: dict[str, tuple[list[int], list[tuple[int, int, Any]]]] = {}
+        count = 0
+        for resource_id, start, end, data in slots:
+            group = groups.get(resource_id)
+            if group is None:
+                group = groups[resource_id] = ([], [])
+            group[0].append(count)
+            group[1].append((start, end, data))
+            count += 1
+
+        results: list[bool] = [False] * count
+        for resource_id, (indices, group_slots) in groups.items():
+            calendar = self._calendars.get(resource_id)
+            if calendar is None:
+                self.add_resource(resource_id)
+                calendar = self._calendars[resource_id]
+
+            group_results = calendar.add_slots_bulk(group_slots)
+            for i, success in zip(indices, group_results, strict=True):
+                results[i] = success
+        return results
+
+    def add_slots_bulk_with_shift(
+        self, slots: Iterable[tuple[str, int, int, Any]]
+    ) -> list[tuple[int, int]]:
+        """Add many slots across resources at once, shifting each as needed.
+
+        Slots are grouped by resource and each group is handed to that
+        resource's CalendarBase.add_slots_bulk_with_shift. Slots for the same
+        resource are placed in the order given, so the result matches adding
+        them one by one.
+
+        Args:
+            slots: Iterable of (resource_id, start, end, data) tuples
+
+        Returns:
+            List of (actual_start, actual_end) tuples for each slot
+
+        Raises:
+            ValueError: If any slot has start >= end
+        """
+        groups: dict[str, tuple[list[int], list[tuple[int, int, Any]]]] = {}
+        count = 0
+        for resource_id, start, end, data in slots:
+            group = groups.get(resource_id)
+            if group is None:
+                group = groups[resource_id] = ([], [])
+            group[0].append(count)
+            group[1].append((start, end, data))
+            count += 1
+
+        results: list[tuple[int, int]] = [(0, 0)] * count
+        for resource_id, (indices, group_slots) in groups.items():
+            calendar = self._calendars.get(resource_id)
+            if calendar is None:
+                self.add_resource(resource_id)
+                calendar = self._calendars[resource_id]
+
+            group_results = calendar.add_slots_bulk_with_shift(group_slots)
+            for i, placement in zip(indices, group_results, strict=True):
+                results[i] = placement
+        return results
 
     def get_slots_at(self, time: int) -> list[tuple[str, int, int, Any]]:
         """Get all slots active at the given time across all resources.
@@ -315,12 +944,37 @@ class Calendar:
         """
         result = []
         for resource_id, calendar in self._calendars.items():
-            slot = calendar.get_slot_at(time)
-            if slot:
-                start, end, data = slot
-                result.append((resource_id, start, end, data))
+            if not calendar:
+                continue
+            slot = calendar._slot_at_epoch(time)  # noqa: SLF001 - same module, integer lookup
+            if slot is not None:
+                result.append((resource_id, *slot))
         return result
 
+    def get_slots_in_range(
+        self, start: int, end: int
+    ) -> list[tuple[str, int, int, Any]]:
+        """Get all slots overlapping the range [start, end) across all resources.
+
+        Args:
+            start: Start of the range
+            end: End of the range
+
+        Returns:
+            List of (resource_id, start, end, data) tuples, grouped by resource
+            and in chronological order within each resource
+
+        Raises:
+            ValueError: If start >= end
+        """
+        if start >= end:
+            raise ValueError(f"Start time ({start}) must be less than end time ({end})")
+        return [
+            (resource_id, *slot)
+            for resource_id, calendar in self._calendars.items()
+            for slot in calendar._slots_in_range_epoch(start, end)  # noqa: SLF001 - same module, integer lookup
+        ]
+
     def get_all_resources(self) -> list[str]:
         """Get list of all resource IDs in the calendar system.
 
@@ -328,3 +982,14 @@ class Calendar:
             List of resource IDs
         """
         return list(self._calendars.keys())
+
+    def iter_resources(self) -> Iterator[str]:
+        """Iterate over resource IDs without copying them into a list.
+
+        Adding or removing resources during iteration raises RuntimeError;
+        use get_all_resources for a snapshot.
+
+        Returns:
+            Iterator of resource IDs
+        """
+        return iter(self._calendars)
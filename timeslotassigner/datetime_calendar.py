@@ -7,11 +7,28 @@ and convert them to epoch seconds internally for O(log N) performance.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any
+from datetime import UTC, datetime, timezone
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import TYPE_CHECKING, Any
 
 from .calendar import Calendar, CalendarBase
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+
+# Most recent conversions; calendars convert the same slot bounds and query
+# times over and over
+_CONVERSION_CACHE_SIZE = 4096
+
+# Proleptic Gregorian ordinal of 1970-01-01, the Unix epoch
+_EPOCH_ORDINAL = 719163
+
+# Bound once; called positionally, since passing tz= by keyword is markedly
+# slower for this C method
+_fromtimestamp = datetime.fromtimestamp
+
 
 def _datetime_to_epoch(dt: datetime) -> int:
     """Convert datetime to epoch seconds (UTC).
@@ -23,12 +40,57 @@ def _datetime_to_epoch(dt: datetime) -> int:
         Unix timestamp as integer seconds since epoch
         
     Note:
-        Naive datetime objects are assumed to be in UTC.
+        Naive datetime objects are assumed to be in UTC. Calendars convert
+        through _to_epoch with their default timezone; this is the same
+        conversion with UTC as the default.
     """
-    if dt.tzinfo is None:
-        # Treat naive datetime as UTC
-        dt = dt.replace(tzinfo=timezone.utc)
-    return int(dt.timestamp())
+    return _to_epoch(dt, UTC)
+
+
+def _convert_datetime_to_epoch(dt: datetime) -> int:
+    tzinfo = dt.tzinfo
+    if tzinfo is not None and tzinfo is not UTC:
+        return int(dt.timestamp())
+
+    # Naive datetimes are treated as UTC, so UTC and naive share the same
+    # wall-clock arithmetic. It is much cheaper than attaching a tzinfo with
+    # replace() just to call timestamp(), and skips timestamp()'s utcoffset()
+    # dispatch for UTC.
+    epoch = (
+        (dt.toordinal() - _EPOCH_ORDINAL) * 86400
+        + dt.hour * 3600 + dt.minute * 60 + dt.second
+    )
+    if epoch < 0 and dt.microsecond:
+        # Match int(dt.timestamp()), which truncates toward zero
+        epoch += 1
+    return epoch
+
+
+_cached_datetime_to_epoch = lru_cache(maxsize=_CONVERSION_CACHE_SIZE)(
+    _convert_datetime_to_epoch
+)
+
+
+def _to_epoch(dt: datetime, default_timezone: timezone) -> int:
+    """Convert datetime to epoch seconds, reading naive ones in default_timezone.
+    
+    Naive datetimes are converted without attaching the tzinfo first when
+    default_timezone is UTC. Calendar entry points convert every bound and
+    query time through here.
+    """
+    if dt.tzinfo is None and default_timezone is not UTC:
+        dt = dt.replace(tzinfo=default_timezone)
+    # Naive datetimes are already read as UTC by the conversion itself
+    if dt.fold:
+        # Datetimes differing only in fold compare and hash equal but may map
+        # to different instants, so they can't share cache entries
+        return _convert_datetime_to_epoch(dt)
+    return _cached_datetime_to_epoch(dt)
+
+
+# (epoch, id(tz)) -> datetime. The cached datetime holds a reference to its
+# tzinfo, so an id can't be reused by another object while its entry exists.
+_epoch_cache: dict[tuple[int, int], datetime] = {}
 
 
 def _epoch_to_datetime(epoch: int, tz: timezone | None = None) -> datetime:
@@ -42,8 +104,31 @@ def _epoch_to_datetime(epoch: int, tz: timezone | None = None) -> datetime:
         Datetime object in specified timezone
     """
     if tz is None:
-        tz = timezone.utc
-    return datetime.fromtimestamp(epoch, tz=tz)
+        tz = UTC
+    key = (epoch, id(tz))
+    dt = _epoch_cache.get(key)
+    if dt is None:
+        if len(_epoch_cache) >= _CONVERSION_CACHE_SIZE:
+            # Start over rather than evicting the oldest entry: repeatedly
+            # deleting from the front of a dict makes next(iter()) skip an
+            # ever longer run of freed slots, so large scans went quadratic
+            _epoch_cache.clear()
+        dt = _epoch_cache[key] = _fromtimestamp(epoch, tz)
+    return dt
+
+
+def _epoch_slots_to_datetime(
+    slots: list[tuple[int, int, Any]], tz: timezone
+) -> list[tuple[datetime, datetime, Any]]:
+    """Convert (start, end, data) epoch slots to datetime slots in tz."""
+    convert: Callable[[int, timezone], datetime]
+    if len(slots) > _CONVERSION_CACHE_SIZE:
+        # More bounds than the cache holds: every lookup would miss and churn
+        # it, so build the datetimes directly
+        convert = _fromtimestamp
+    else:
+        convert = _epoch_to_datetime
+    return [(convert(start, tz), convert(end, tz), data) for start, end, data in slots]
 
 
 class DatetimeCalendarBase(CalendarBase):
@@ -54,6 +139,8 @@ class DatetimeCalendarBase(CalendarBase):
     seconds for storage and processing.
     """
     
+    __slots__ = ("default_timezone",)
+    
     def __init__(self, resource_id: str, default_timezone: timezone | None = None) -> None:
         """Initialize a datetime calendar for a single resource.
         
@@ -62,7 +149,7 @@ class DatetimeCalendarBase(CalendarBase):
             default_timezone: Default timezone for naive datetime objects (defaults to UTC)
         """
         super().__init__(resource_id)
-        self.default_timezone = default_timezone or timezone.utc
+        self.default_timezone = default_timezone or UTC
     
     def add_slot(self, start: datetime, end: datetime, data: Any = None) -> bool:
         """Add a time-slot using datetime objects.
@@ -86,8 +173,8 @@ class DatetimeCalendarBase(CalendarBase):
             >>> calendar.add_slot(start, end, "meeting")
             True
         """
-        start_epoch = _datetime_to_epoch(self._normalize_datetime(start))
-        end_epoch = _datetime_to_epoch(self._normalize_datetime(end))
+        start_epoch = _to_epoch(start, self.default_timezone)
+        end_epoch = _to_epoch(end, self.default_timezone)
         return super().add_slot(start_epoch, end_epoch, data)
     
     def add_slot_with_shift(
@@ -119,14 +206,78 @@ class DatetimeCalendarBase(CalendarBase):
             >>> actual_start
             datetime.datetime(2024, 1, 15, 15, 0, tzinfo=datetime.timezone.utc)
         """
-        start_epoch = _datetime_to_epoch(self._normalize_datetime(start))
-        end_epoch = _datetime_to_epoch(self._normalize_datetime(end))
+        tz = self.default_timezone
         actual_start_epoch, actual_end_epoch = super().add_slot_with_shift(
-            start_epoch, end_epoch, data
+            _to_epoch(start, tz), _to_epoch(end, tz), data
         )
         return (
-            _epoch_to_datetime(actual_start_epoch, self.default_timezone),
-            _epoch_to_datetime(actual_end_epoch, self.default_timezone),
+            _epoch_to_datetime(actual_start_epoch, tz),
+            _epoch_to_datetime(actual_end_epoch, tz),
+        )
+    
+    def add_slots_bulk(
+        self, slots: Iterable[tuple[datetime, datetime, Any]]
+    ) -> list[bool]:
+        """Add many time-slots at once using datetime objects.
+        
+        Args:
+            slots: Iterable of (start_dt, end_dt, data) tuples
+            
+        Returns:
+            List of bool indicating success/failure for each slot
+            
+        Raises:
+            ValueError: If any slot has start >= end (no slot is added)
+        """
+        return super().add_slots_bulk(
+            (
+                _to_epoch(start, self.default_timezone),
+                _to_epoch(end, self.default_timezone),
+                data,
+            )
+            for start, end, data in slots
+        )
+    
+    def add_slots_bulk_with_shift(
+        self, slots: Iterable[tuple[datetime, datetime, Any]]
+    ) -> list[tuple[datetime, datetime]]:
+        """Add many time-slots at once with automatic shifting using datetime objects.
+        
+        Args:
+            slots: Iterable of (start_dt, end_dt, data) tuples
+            
+        Returns:
+            List of (actual_start_dt, actual_end_dt) tuples for each slot
+            
+        Raises:
+            ValueError: If any slot has start >= end (no slot is added)
+        """
+        # Convert every bound up front so the epoch-level batch runs without
+        # calling back into datetime code, then convert the placements back
+        tz = self.default_timezone
+        placements = super().add_slots_bulk_with_shift(
+            [(_to_epoch(start, tz), _to_epoch(end, tz), data) for start, end, data in slots]
+        )
+        return [
+            (_epoch_to_datetime(start, tz), _epoch_to_datetime(end, tz))
+            for start, end in placements
+        ]
+    
+    def count_conflicts(self, ranges: Iterable[tuple[datetime, datetime]]) -> int:
+        """Count how many datetime ranges would conflict with existing slots.
+        
+        Args:
+            ranges: Iterable of (start_dt, end_dt) tuples
+            
+        Returns:
+            Number of ranges that overlap at least one existing slot
+        """
+        return super().count_conflicts(
+            (
+                _to_epoch(start, self.default_timezone),
+                _to_epoch(end, self.default_timezone),
+            )
+            for start, end in ranges
         )
     
     def remove_slot(self, start: datetime) -> bool:
@@ -148,7 +299,7 @@ class DatetimeCalendarBase(CalendarBase):
             >>> calendar.remove_slot(start)
             True
         """
-        start_epoch = _datetime_to_epoch(self._normalize_datetime(start))
+        start_epoch = _to_epoch(start, self.default_timezone)
         return super().remove_slot(start_epoch)
     
     def get_slot_at(self, time: datetime) -> tuple[datetime, datetime, Any] | None:
@@ -171,32 +322,62 @@ class DatetimeCalendarBase(CalendarBase):
             >>> calendar.get_slot_at(query_time)
             (datetime.datetime(2024, 1, 15, 10, 0, tzinfo=datetime.timezone.utc), ...)
         """
-        time_epoch = _datetime_to_epoch(self._normalize_datetime(time))
-        result = super().get_slot_at(time_epoch)
+        tz = self.default_timezone
+        result = self._slot_at_epoch(_to_epoch(time, tz))
         if result:
             start_epoch, end_epoch, data = result
-            return (
-                _epoch_to_datetime(start_epoch, self.default_timezone),
-                _epoch_to_datetime(end_epoch, self.default_timezone),
-                data,
-            )
+            return _epoch_to_datetime(start_epoch, tz), _epoch_to_datetime(end_epoch, tz), data
         return None
     
+    def get_payload_at(self, time: datetime) -> Any:
+        """Get only the data of the slot active at the given datetime.
+        
+        Skips converting the slot bounds back to datetime objects.
+        
+        Args:
+            time: Datetime to check
+            
+        Returns:
+            Data of the active slot, or None if no slot is active
+        """
+        return super().get_payload_at(_to_epoch(time, self.default_timezone))
+    
     def get_all_slots(self) -> list[tuple[datetime, datetime, Any]]:
         """Get all slots in chronological order with datetime objects.
         
         Returns:
             List of (start_dt, end_dt, data) tuples
         """
-        epoch_slots = super().get_all_slots()
-        return [
-            (
-                _epoch_to_datetime(start_epoch, self.default_timezone),
-                _epoch_to_datetime(end_epoch, self.default_timezone),
-                data,
-            )
-            for start_epoch, end_epoch, data in epoch_slots
-        ]
+        tz = self.default_timezone
+        if len(self) > _CONVERSION_CACHE_SIZE:
+            # Too many bounds to cache: map the constructor over the stored
+            # columns so the conversion loop runs without per-slot bytecode
+            return list(zip(
+                map(_fromtimestamp, chain.from_iterable(self._starts), repeat(tz)),
+                map(_fromtimestamp, chain.from_iterable(self._ends), repeat(tz)),
+                chain.from_iterable(self._data),
+                strict=True,
+            ))
+        return _epoch_slots_to_datetime(super().get_all_slots(), tz)
+    
+    def get_slots_in_range(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime, Any]]:
+        """Get all slots overlapping the datetime range [start, end).
+        
+        Args:
+            start: Start datetime of the range
+            end: End datetime of the range
+            
+        Returns:
+            List of (start_dt, end_dt, data) tuples in chronological order
+            
+        Raises:
+            ValueError: If start >= end
+        """
+        tz = self.default_timezone
+        epoch_slots = self._slots_in_range_epoch(_to_epoch(start, tz), _to_epoch(end, tz))
+        return _epoch_slots_to_datetime(epoch_slots, tz)
     
     def left_slot(self, start: datetime) -> tuple[datetime, datetime, Any] | None:
         """Get the slot immediately before the given start datetime.
@@ -207,15 +388,11 @@ class DatetimeCalendarBase(CalendarBase):
         Returns:
             Tuple of (start_dt, end_dt, data) of the previous slot, or None if no previous slot
         """
-        start_epoch = _datetime_to_epoch(self._normalize_datetime(start))
-        result = super().left_slot(start_epoch)
+        tz = self.default_timezone
+        result = super().left_slot(_to_epoch(start, tz))
         if result:
             start_epoch, end_epoch, data = result
-            return (
-                _epoch_to_datetime(start_epoch, self.default_timezone),
-                _epoch_to_datetime(end_epoch, self.default_timezone),
-                data,
-            )
+            return _epoch_to_datetime(start_epoch, tz), _epoch_to_datetime(end_epoch, tz), data
         return None
     
     def right_slot(self, start: datetime) -> tuple[datetime, datetime, Any] | None:
@@ -227,29 +404,38 @@ class DatetimeCalendarBase(CalendarBase):
         Returns:
             Tuple of (start_dt, end_dt, data) of the next slot, or None if no next slot
         """
-        start_epoch = _datetime_to_epoch(self._normalize_datetime(start))
-        result = super().right_slot(start_epoch)
+        tz = self.default_timezone
+        result = super().right_slot(_to_epoch(start, tz))
         if result:
             start_epoch, end_epoch, data = result
-            return (
-                _epoch_to_datetime(start_epoch, self.default_timezone),
-                _epoch_to_datetime(end_epoch, self.default_timezone),
+            return _epoch_to_datetime(start_epoch, tz), _epoch_to_datetime(end_epoch, tz), data
+        return None
+    
+    def __iter__(self) -> Iterator[tuple[datetime, datetime, Any]]:
+        """Iterate over (start_dt, end_dt, data) slots in chronological order."""
+        tz = self.default_timezone
+        for start_epoch, end_epoch, data in super().__iter__():
+            yield (
+                _epoch_to_datetime(start_epoch, tz),
+                _epoch_to_datetime(end_epoch, tz),
                 data,
             )
-        return None
     
-    def _normalize_datetime(self, dt: datetime) -> datetime:
-        """Normalize datetime object by applying default timezone to naive datetimes.
-        
-        Args:
-            dt: Input datetime object
-            
-        Returns:
-            Timezone-aware datetime object
-        """
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=self.default_timezone)
-        return dt
+    def __contains__(self, slot: object) -> bool:
+        """Check whether a (start_dt, end_dt, data) slot is in the calendar."""
+        if not isinstance(slot, tuple):
+            return False
+        try:
+            start, end, data = slot
+        except ValueError:
+            return False
+        if not isinstance(start, datetime) or not isinstance(end, datetime):
+            return False
+        return super().__contains__((
+            _to_epoch(start, self.default_timezone),
+            _to_epoch(end, self.default_timezone),
+            data,
+        ))
 
 
 class DatetimeCalendar(Calendar):
@@ -259,6 +445,8 @@ class DatetimeCalendar(Calendar):
     Each resource gets its own DatetimeCalendarBase instance for O(log N) performance.
     """
     
+    __slots__ = ("default_timezone",)
+    
     def __init__(
         self, 
         resources: list[str] | None = None, 
@@ -270,7 +458,7 @@ class DatetimeCalendar(Calendar):
             resources: Optional list of resource IDs to initialize
             default_timezone: Default timezone for naive datetime objects
         """
-        self.default_timezone = default_timezone or timezone.utc
+        self.default_timezone = default_timezone or UTC
         self._calendars: dict[str, DatetimeCalendarBase] = {}
         if resources:
             for resource_id in resources:
@@ -298,11 +486,7 @@ class DatetimeCalendar(Calendar):
         Returns:
             True if resource was removed, False if it didn't exist
         """
-        try:
-            del self._calendars[resource_id]
-            return True
-        except KeyError:
-            return False
+        return self._calendars.pop(resource_id, None) is not None
     
     def get_calendar(self, resource_id: str) -> DatetimeCalendarBase | None:
         """Get the calendar for a specific resource.
@@ -337,10 +521,12 @@ class DatetimeCalendar(Calendar):
             >>> calendar.add_slot("alice", start, end, "standup")
             True
         """
-        if resource_id not in self._calendars:
+        calendar = self._calendars.get(resource_id)
+        if calendar is None:
             self.add_resource(resource_id)
+            calendar = self._calendars[resource_id]
         
-        return self._calendars[resource_id].add_slot(start, end, data)
+        return calendar.add_slot(start, end, data)
     
     def add_slot_with_shift(
         self, resource_id: str, start: datetime, end: datetime, data: Any = None
@@ -356,10 +542,12 @@ class DatetimeCalendar(Calendar):
         Returns:
             Tuple of (actual_start_dt, actual_end_dt) after any necessary shifting
         """
-        if resource_id not in self._calendars:
+        calendar = self._calendars.get(resource_id)
+        if calendar is None:
             self.add_resource(resource_id)
+            calendar = self._calendars[resource_id]
         
-        return self._calendars[resource_id].add_slot_with_shift(start, end, data)
+        return calendar.add_slot_with_shift(start, end, data)
     
     def get_slots_at(self, time: datetime) -> list[tuple[str, datetime, datetime, Any]]:
         """Get all slots active at the given datetime across all resources.
@@ -383,13 +571,48 @@ class DatetimeCalendar(Calendar):
             >>> calendar.get_slots_at(query_time)
             [("alice", ...), ("bob", ...)]
         """
-        result = []
-        for resource_id, calendar in self._calendars.items():
-            slot = calendar.get_slot_at(time)
-            if slot:
-                start_dt, end_dt, data = slot
-                result.append((resource_id, start_dt, end_dt, data))
-        return result
+        # Every resource calendar shares this default timezone, so convert the
+        # query time once and let Calendar search the epoch-based calendars
+        tz = self.default_timezone
+        return [
+            (
+                resource_id,
+                _epoch_to_datetime(start_epoch, tz),
+                _epoch_to_datetime(end_epoch, tz),
+                data,
+            )
+            for resource_id, start_epoch, end_epoch, data in super().get_slots_at(
+                _to_epoch(time, tz)
+            )
+        ]
+    
+    def get_slots_in_range(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[str, datetime, datetime, Any]]:
+        """Get all slots overlapping the datetime range [start, end) across all resources.
+        
+        Args:
+            start: Start datetime of the range
+            end: End datetime of the range
+            
+        Returns:
+            List of (resource_id, start_dt, end_dt, data) tuples, grouped by
+            resource and in chronological order within each resource
+            
+        Raises:
+            ValueError: If start >= end
+        """
+        tz = self.default_timezone
+        result = super().get_slots_in_range(_to_epoch(start, tz), _to_epoch(end, tz))
+        return [
+            (
+                resource_id,
+                _epoch_to_datetime(start_epoch, tz),
+                _epoch_to_datetime(end_epoch, tz),
+                data,
+            )
+            for resource_id, start_epoch, end_epoch, data in result
+        ]
     
     def get_all_resources(self) -> list[str]:
         """Get list of all resource IDs in the calendar system.
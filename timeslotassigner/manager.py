@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from .calendar import Calendar
+from .calendar import _SMALL_BATCH, Calendar
 
 
 class CalendarManager:
@@ -40,11 +40,7 @@ class CalendarManager:
         Returns:
             True if calendar was removed, False if key didn't exist
         """
-        try:
-            del self._calendars[key]
-            return True
-        except KeyError:
-            return False
+        return self._calendars.pop(key, None) is not None
 
     def get_calendar(self, key: Any) -> Calendar | None:
         """Get a calendar by key.
@@ -63,7 +59,7 @@ class CalendarManager:
         Returns:
             List of all calendar keys
         """
-        return list(self._calendars.keys())
+        return list(self._calendars)
 
     def add_slot(
         self,
@@ -85,10 +81,12 @@ class CalendarManager:
         Returns:
             True if slot was added successfully, False otherwise
         """
-        if calendar_key not in self._calendars:
+        calendar = self._calendars.get(calendar_key)
+        if calendar is None:
             self.add_calendar(calendar_key)
+            calendar = self._calendars[calendar_key]
 
-        return self._calendars[calendar_key].add_slot(resource_id, start, end, data)
+        return calendar.add_slot(resource_id, start, end, data)
 
     def add_slot_with_shift(
         self,
@@ -110,12 +108,12 @@ class CalendarManager:
         Returns:
             Tuple of (actual_start, actual_end) after any necessary shifting
         """
-        if calendar_key not in self._calendars:
+        calendar = self._calendars.get(calendar_key)
+        if calendar is None:
             self.add_calendar(calendar_key)
+            calendar = self._calendars[calendar_key]
 
-        return self._calendars[calendar_key].add_slot_with_shift(
-            resource_id, start, end, data
-        )
+        return calendar.add_slot_with_shift(resource_id, start, end, data)
 
     def get_slots_at(
         self, time: int, calendar_key: Any | None = None
@@ -154,10 +152,9 @@ class CalendarManager:
             List of (calendar_key, resource_id, start, end, data) tuples
         """
         result = []
-        slots_by_calendar = self.get_slots_at(time)
-
-        for calendar_key, slots in slots_by_calendar.items():
-            for resource_id, start, end, data in slots:
+        # Scan the calendars directly instead of building the per-calendar dict
+        for calendar_key, calendar in self._calendars.items():
+            for resource_id, start, end, data in calendar.get_slots_at(time):
                 result.append((calendar_key, resource_id, start, end, data))
 
         return result
@@ -169,10 +166,12 @@ class CalendarManager:
             calendar_key: Key of the calendar
             resource_id: Resource to add
         """
-        if calendar_key not in self._calendars:
+        calendar = self._calendars.get(calendar_key)
+        if calendar is None:
             self.add_calendar(calendar_key)
+            calendar = self._calendars[calendar_key]
 
-        self._calendars[calendar_key].add_resource(resource_id)
+        calendar.add_resource(resource_id)
 
     def get_calendar_resources(self, calendar_key: Any) -> list[str]:
         """Get all resources in a specific calendar.
@@ -202,16 +201,52 @@ class CalendarManager:
     ) -> list[bool]:
         """Bulk assign multiple slots across different calendars and resources.
 
+        Assignments are grouped by (calendar_key, resource_id) and each larger
+        group is handed straight to that resource's CalendarBase.add_slots_bulk,
+        so the result matches assigning them one by one in the given order.
+
         Args:
             assignments: List of (calendar_key, resource_id, start, end, data) tuples
 
         Returns:
             List of bool indicating success/failure for each assignment
+
+        Raises:
+            ValueError: If any assignment has start >= end (nothing is assigned)
         """
-        results = []
-        for calendar_key, resource_id, start, end, data in assignments:
-            success = self.add_slot(calendar_key, resource_id, start, end, data)
-            results.append(success)
+        groups: dict[tuple[Any, str], list[int]] = {}
+        for i, (calendar_key, resource_id, start, end, _) in enumerate(assignments):
+            if start >= end:
+                raise ValueError(
+                    f"Start time ({start}) must be less than end time ({end})"
+                )
+            groups.setdefault((calendar_key, resource_id), []).append(i)
+
+        calendars = self._calendars
+        results = [False] * len(assignments)
+        for (calendar_key, resource_id), indices in groups.items():
+            calendar = calendars.get(calendar_key)
+            if calendar is None:
+                self.add_calendar(calendar_key)
+                calendar = calendars[calendar_key]
+            # Already grouped by resource, so skip Calendar's own regrouping
+            resource_calendar = calendar.get_calendar(resource_id)
+            if resource_calendar is None:
+                calendar.add_resource(resource_id)
+                resource_calendar = calendar.get_calendar(resource_id)
+                assert resource_calendar is not None  # add_resource just created it
+            if len(indices) <= _SMALL_BATCH:
+                # Same cutoff as add_slots_bulk: skip the batch bookkeeping
+                add_slot = resource_calendar.add_slot
+                for i in indices:
+                    _, _, start, end, data = assignments[i]
+                    results[i] = add_slot(start, end, data)
+                continue
+            group_results = resource_calendar.add_slots_bulk(
+                [assignments[i][2:] for i in indices]
+            )
+            for i, success in zip(indices, group_results, strict=True):
+                results[i] = success
         return results
 
     def bulk_assign_slots_with_shift(
@@ -219,16 +254,40 @@ class CalendarManager:
     ) -> list[tuple[int, int]]:
         """Bulk assign multiple slots with automatic shifting.
 
+        Assignments are grouped by calendar_key and each group is handed to
+        that calendar's Calendar.add_slots_bulk_with_shift. Slots for the same
+        resource are still placed in the order given, so the result matches
+        assigning them one by one.
+
         Args:
             assignments: List of (calendar_key, resource_id, start, end, data) tuples
 
         Returns:
             List of (actual_start, actual_end) tuples for each assignment
+
+        Raises:
+            ValueError: If any assignment has start >= end (nothing is assigned)
         """
-        results = []
-        for calendar_key, resource_id, start, end, data in assignments:
-            actual_times = self.add_slot_with_shift(
-                calendar_key, resource_id, start, end, data
-            )
-            results.append(actual_times)
+        groups: dict[Any, tuple[list[int], list[tuple[str, int, int, Any]]]] = {}
+        for i, (calendar_key, resource_id, start, end, data) in enumerate(assignments):
+            if start >= end:
+                raise ValueError(
+                    f"Start time ({start}) must be less than end time ({end})"
+                )
+            group = groups.get(calendar_key)
+            if group is None:
+                group = groups[calendar_key] = ([], [])
+            group[0].append(i)
+            group[1].append((resource_id, start, end, data))
+
+        calendars = self._calendars
+        results: list[tuple[int, int]] = [(0, 0)] * len(assignments)
+        for calendar_key, (indices, group_assignments) in groups.items():
+            calendar = calendars.get(calendar_key)
+            if calendar is None:
+                self.add_calendar(calendar_key)
+                calendar = calendars[calendar_key]
+            group_results = calendar.add_slots_bulk_with_shift(group_assignments)
+            for i, placement in zip(indices, group_results, strict=True):
+                results[i] = placement
         return results